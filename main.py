@@ -1,23 +1,334 @@
 import os
 import shutil
+import stat
 import sys
 import subprocess
+import time
 import platform
-import threading
 import json
 import logging
+import logging.handlers
+import queue
+import re
+import functools
+import hashlib
+import hmac
+import ipaddress
+import types
 from datetime import datetime
+from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QPushButton, QFrame, QTabWidget,
                              QLineEdit, QRadioButton, QCheckBox, QProgressBar,
                              QTextEdit, QFileDialog, QMessageBox, QDialog,
-                             QGroupBox, QGridLayout, QFormLayout, QScrollArea)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPixmap, QPainter
-
-
+                             QGroupBox, QGridLayout)
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot, QSize
+from PyQt6.QtGui import QFont, QColor, QIcon, QPixmap, QPainter
+
+
+# Default application settings, shared read-only by every load
+DEFAULT_SETTINGS = types.MappingProxyType({
+    'source_path': '',
+    'destination_path': '',
+    'network_ip': '127.0.0.1',
+    'password': 'password',
+    'folder_type': 'local',
+    'auto_close': False,
+})
+
+# Expected type of each persisted setting
+SETTINGS_TYPES = types.MappingProxyType({
+    'source_path': str,
+    'destination_path': str,
+    'network_ip': str,
+    'password': str,
+    'folder_type': str,
+    'auto_close': bool,
+})
+
+VALID_FOLDER_TYPES = frozenset({'local', 'network'})
+
+# ping arguments for a single echo with a 3 second wait; the target host is appended.
+# On Windows, CREATE_NO_WINDOW stops a console window flashing up for each check.
+if platform.system() == "Windows":
+    PING_COMMAND = ("ping", "-n", "1", "-w", "3000")
+    PING_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW
+else:
+    PING_COMMAND = ("ping", "-c", "1", "-W", "3")
+    PING_CREATION_FLAGS = 0
+
+# One DNS label: 1-63 letters, digits or hyphens, not starting or ending with a hyphen
+HOSTNAME_LABEL_RE = re.compile(r"(?!-)[A-Za-z0-9-]{1,63}(?<!-)")
+
+# Log file writes are batched: one write per LOG_BUFFER_CAPACITY records, or every
+# LOG_FLUSH_INTERVAL seconds, whichever comes first. Warnings and errors are written at once.
+LOG_BUFFER_CAPACITY = 100
+LOG_FLUSH_INTERVAL = 30
+
+# Stored passwords look like "blake2b$<salt hex>$<digest hex>"
+PASSWORD_HASH_PREFIX = 'blake2b$'
+
+# Pastel color palette the stylesheets below are built from
+COLORS = types.MappingProxyType({
+    'text': '#333333',
+    'title': '#495057',
+    'background': '#f8f9fa',
+    'surface': '#ffffff',
+    'panel': '#e9ecef',
+    'border': '#dee2e6',
+    'progress': '#b8e6b8',
+    'accent': '#a8dadc',
+    'accent_hover': '#96d2d4',
+    'accent_hover_translucent': 'rgba(168, 218, 220, 0.3)',
+    'accent_pressed_translucent': 'rgba(168, 218, 220, 0.5)',
+    'copy_button': '#b8e6b8',
+    'settings_button': '#a8dadc',
+    'logout_button': '#ffb3ba',
+    'connected': '#28a745',
+    'disconnected': '#dc3545',
+})
+
+
+def minify_qss(style):
+    """Collapse a stylesheet's indentation and newlines so Qt parses a compact string"""
+    style = re.sub(r'\s+', ' ', style)
+    return re.sub(r' ?([{};]) ?', r'\1', style).strip()
+
+
+# Stylesheets, built once at import and shared by every widget instance
+DIALOG_BASE_STYLE = """
+    QDialog {{
+        background-color: {background};
+    }}
+    QLabel {{
+        color: {text};
+    }}
+""".format_map(COLORS)
+
+DIALOG_BUTTON_STYLE = """
+    QPushButton {{
+        padding: 8px 16px;
+        border: none;
+        border-radius: 5px;
+        font-weight: bold;
+        background-color: {accent};
+        color: {text};
+    }}
+    QPushButton:hover {{
+        background-color: {accent_hover};
+    }}
+""".format_map(COLORS)
+
+MESSAGE_BOX_STYLE = minify_qss(DIALOG_BASE_STYLE + DIALOG_BUTTON_STYLE)
+
+PASSWORD_DIALOG_STYLE = minify_qss(DIALOG_BASE_STYLE + """
+    QLabel {{
+        margin: 10px;
+    }}
+    QLineEdit {{
+        padding: 8px;
+        border: 2px solid {panel};
+        border-radius: 5px;
+        background-color: {surface};
+        margin: 5px;
+    }}
+    QPushButton {{
+        padding: 8px 20px;
+        border: none;
+        border-radius: 5px;
+        font-weight: bold;
+        margin: 5px;
+    }}
+""".format_map(COLORS))
+
+SETTINGS_DIALOG_STYLE = minify_qss(DIALOG_BASE_STYLE + DIALOG_BUTTON_STYLE + """
+    QLabel {{
+        font-size: 12px;
+    }}
+    QGroupBox {{
+        font-weight: bold;
+        border: 2px solid {panel};
+        border-radius: 5px;
+        margin: 10px 0px;
+        padding-top: 10px;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }}
+    QLineEdit {{
+        padding: 8px;
+        border: 2px solid {panel};
+        border-radius: 5px;
+        background-color: {surface};
+        margin: 2px;
+    }}
+    QPushButton {{
+        margin: 2px;
+    }}
+    QCheckBox, QRadioButton {{
+        font-size: 11px;
+        color: {text};
+        margin: 5px;
+    }}
+    QTabWidget::pane {{
+        border: 1px solid {panel};
+        border-radius: 5px;
+    }}
+    QTabBar::tab {{
+        background-color: {panel};
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+    }}
+    QTabBar::tab:selected {{
+        background-color: {accent};
+    }}
+""".format_map(COLORS))
+
+# Main window action buttons: (objectName, COLORS key of the background)
+BUTTON_VARIANTS = (
+    ('copyButton', 'copy_button'),
+    ('settingsButton', 'settings_button'),
+    ('logoutButton', 'logout_button'),
+)
+
+BUTTON_VARIANT_TEMPLATE = """
+    QPushButton#{name} {{
+        background-color: {background};
+        color: {text};
+    }}
+"""
+
+BUTTON_VARIANT_STYLE = ''.join(
+    BUTTON_VARIANT_TEMPLATE.format_map({**COLORS, 'name': name, 'background': COLORS[background]})
+    for name, background in BUTTON_VARIANTS
+)
+
+MAIN_WINDOW_STYLE = minify_qss("""
+    QMainWindow {{
+        background-color: {background};
+    }}
+    QLabel {{
+        color: {text};
+    }}
+    QFrame {{
+        background-color: {panel};
+        border: 1px solid {border};
+        border-radius: 8px;
+        padding: 15px;
+        margin: 5px;
+    }}
+    QGroupBox {{
+        font-weight: bold;
+        border: 2px solid {border};
+        border-radius: 8px;
+        margin: 5px 0px;
+        padding-top: 15px;
+        background-color: {surface};
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        color: {title};
+    }}
+    QPushButton {{
+        border: none;
+        border-radius: 8px;
+        padding: 12px 24px;
+        font-weight: bold;
+        margin: 2px;
+    }}
+    QProgressBar {{
+        border: 2px solid {border};
+        border-radius: 5px;
+        text-align: center;
+        background-color: {background};
+    }}
+    QProgressBar::chunk {{
+        background-color: {progress};
+        border-radius: 3px;
+    }}
+    QTextEdit {{
+        border: 2px solid {border};
+        border-radius: 5px;
+        background-color: {surface};
+        color: {text};
+    }}
+    QLabel#networkStatusLabel[connected="true"] {{
+        color: {connected};
+        font-weight: bold;
+    }}
+    QLabel#networkStatusLabel[connected="false"] {{
+        color: {disconnected};
+        font-weight: bold;
+    }}
+    QPushButton#refreshButton {{
+        background: none;
+        border: none;
+        color: #000000;
+        font-size: 18px;
+        font-weight: bold;
+    }}
+    QPushButton#refreshButton:hover {{
+        background-color: {accent_hover_translucent};
+        border-radius: 5px;
+    }}
+    QPushButton#refreshButton:pressed {{
+        background-color: {accent_pressed_translucent};
+        border-radius: 5px;
+    }}
+""".format_map(COLORS) + BUTTON_VARIANT_STYLE)
+
+
+def is_valid_host(host):
+    """Return True if host is a literal IP address or a syntactically valid DNS name"""
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        pass
+
+    host = host[:-1] if host.endswith(".") else host
+    labels = host.split(".")
+    # An all-numeric last label means a malformed IPv4 address, not a name
+    if not host or len(host) > 253 or labels[-1].isdigit():
+        return False
+    return all(HOSTNAME_LABEL_RE.fullmatch(label) for label in labels)
+
+
+def hash_password(password, salt=None):
+    """Return the salted hash of a password in its stored form"""
+    if salt is None:
+        salt = os.urandom(hashlib.blake2b.SALT_SIZE)
+    digest = hashlib.blake2b(password.encode('utf-8'), salt=salt).hexdigest()
+    return f"{PASSWORD_HASH_PREFIX}{salt.hex()}${digest}"
+
+
+def verify_password(password, stored_hash):
+    """Check a password against its stored hash in constant time"""
+    try:
+        salt = bytes.fromhex(stored_hash[len(PASSWORD_HASH_PREFIX):].split('$')[0])
+        candidate = hash_password(password, salt)
+    except ValueError:
+        return False
+    return hmac.compare_digest(candidate, stored_hash)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_font(family, point_size, bold=False):
+    """Return the shared QFont for a family, size and weight, built on first use"""
+    if bold:
+        return QFont(family, point_size, QFont.Weight.Bold)
+    return QFont(family, point_size)
+
+
+@functools.lru_cache(maxsize=None)
 def create_black_white_emoji_icon(emoji, size=32):
-    """Create a black and white QIcon from an emoji character"""
+    """Create a black and white QIcon from an emoji character, rendered once per emoji"""
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
 
@@ -25,8 +336,7 @@ def create_black_white_emoji_icon(emoji, size=32):
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
     # Set font and color for black and white emoji
-    font = QFont("Segoe UI Emoji", int(size * 0.6))
-    painter.setFont(font)
+    painter.setFont(cached_font("Segoe UI Emoji", int(size * 0.6)))
     painter.setPen(QColor(0, 0, 0))  # Black color
 
     # Draw emoji centered in black
@@ -49,6 +359,31 @@ class LogHandler(logging.Handler):
             self.log_signal.emit(log_entry)
 
 
+class PeriodicFlushQueueListener(logging.handlers.QueueListener):
+    """QueueListener that also flushes its handlers every flush_interval seconds"""
+
+    def __init__(self, log_queue, *handlers, flush_interval):
+        super().__init__(log_queue, *handlers)
+        self.flush_interval = flush_interval
+        self.next_flush = time.monotonic() + flush_interval
+
+    def dequeue(self, block):
+        # Runs on the listener thread, so buffered records reach the file
+        # on time even in a quiet session, without touching the GUI thread
+        while True:
+            timeout = self.next_flush - time.monotonic()
+            if timeout <= 0:
+                for handler in self.handlers:
+                    handler.flush()
+                self.next_flush = time.monotonic() + self.flush_interval
+                continue
+            try:
+                return self.queue.get(block, timeout)
+            except queue.Empty:
+                if not block:
+                    raise
+
+
 class CopyWorker(QThread):
     """Worker thread for folder copying operations"""
     progress_updated = pyqtSignal(int, str)
@@ -67,7 +402,7 @@ class CopyWorker(QThread):
         try:
             self.smart_folder_copy()
         except Exception as e:
-            self.logger.error(f"Copy operation failed: {str(e)}")
+            self.logger.error("Copy operation failed: %s", e)
             self.copy_finished.emit(False, str(e))
 
     def cancel(self):
@@ -118,52 +453,66 @@ class CopyWorker(QThread):
                 self.copy_finished.emit(True, "Folder copied successfully!")
 
         except Exception as e:
-            self.logger.error(f"Smart copy failed: {str(e)}")
+            self.logger.error("Smart copy failed: %s", e)
             # Try to restore backup if copy failed
             if os.path.exists(destination_old_path) and not os.path.exists(destination_full_path):
                 try:
                     os.rename(destination_old_path, destination_full_path)
                     self.log_message.emit("Restored original folder after copy failure")
                 except Exception as restore_error:
-                    self.logger.error(f"Failed to restore backup: {str(restore_error)}")
+                    self.logger.error("Failed to restore backup: %s", restore_error)
 
             self.copy_finished.emit(False, str(e))
 
     def copy_tree_with_progress(self, src, dst, total_files):
         """Copy directory tree with progress updates"""
         copied_files = 0
+        last_progress = None
+        # Per-file log lines go to the GUI in batches, one per progress step
+        pending_log = []
 
-        for root, dirs, files in os.walk(src):
-            if self.is_cancelled:
-                break
+        try:
+            for root, dirs, files in os.walk(src):
+                if self.is_cancelled:
+                    break
 
-            # Create corresponding directory structure
-            rel_path = os.path.relpath(root, src)
-            dst_root = os.path.join(dst, rel_path) if rel_path != '.' else dst
+                # Create corresponding directory structure
+                rel_path = os.path.relpath(root, src)
+                dst_root = os.path.join(dst, rel_path) if rel_path != '.' else dst
 
-            if not os.path.exists(dst_root):
-                os.makedirs(dst_root)
+                if not os.path.exists(dst_root):
+                    os.makedirs(dst_root)
 
-            # Copy files
-            for file in files:
-                if self.is_cancelled:
-                    break
+                # Copy files
+                for file in files:
+                    if self.is_cancelled:
+                        break
 
-                src_file = os.path.join(root, file)
-                dst_file = os.path.join(dst_root, file)
+                    src_file = os.path.join(root, file)
+                    dst_file = os.path.join(dst_root, file)
 
-                try:
-                    shutil.copy2(src_file, dst_file)
-                    copied_files += 1
+                    try:
+                        shutil.copy2(src_file, dst_file)
+                        copied_files += 1
+                        pending_log.append(f"Copied: {src_file}")
 
-                    # Update progress
-                    progress = 25 + int((copied_files / total_files) * 70)  # 25-95% range
-                    self.progress_updated.emit(progress, f"Copying: {file}")
-                    self.log_message.emit(f"Copied: {src_file}")
+                        # Update progress only when the percentage moves, so large trees
+                        # don't flood the GUI thread with identical repaints
+                        progress = 25 + int((copied_files / total_files) * 70)  # 25-95% range
+                        if progress != last_progress:
+                            last_progress = progress
+                            self.progress_updated.emit(progress, f"Copying: {file}")
+                            self.log_message.emit("\n".join(pending_log))
+                            pending_log.clear()
 
-                except Exception as e:
-                    self.log_message.emit(f"Failed to copy {src_file}: {str(e)}")
-                    raise
+                    except Exception as e:
+                        pending_log.append(f"Failed to copy {src_file}: {str(e)}")
+                        raise
+
+        finally:
+            # Whatever is left when the copy ends, is cancelled or fails
+            if pending_log:
+                self.log_message.emit("\n".join(pending_log))
 
         if not self.is_cancelled:
             self.progress_updated.emit(100, "Copy completed!")
@@ -171,28 +520,26 @@ class CopyWorker(QThread):
 
 class NetworkChecker(QThread):
     """Worker thread for network connectivity checking"""
-    status_updated = pyqtSignal(bool, str)
+    status_updated = pyqtSignal(str, bool, str)
 
-    def __init__(self, ip_address):
-        super().__init__()
+    def __init__(self, ip_address, parent=None):
+        super().__init__(parent)
         self.ip_address = ip_address
 
     def run(self):
         """Check network connectivity"""
         try:
-            if platform.system().lower() == "windows":
-                cmd = ["ping", "-n", "1", "-w", "3000", self.ip_address]
-            else:
-                cmd = ["ping", "-c", "1", "-W", "3", self.ip_address]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = subprocess.run((*PING_COMMAND, self.ip_address), capture_output=True,
+                                    timeout=5, creationflags=PING_CREATION_FLAGS)
             is_connected = result.returncode == 0
 
             status_text = f"Connected ({self.ip_address})" if is_connected else f"Disconnected ({self.ip_address})"
-            self.status_updated.emit(is_connected, status_text)
+            self.status_updated.emit(self.ip_address, is_connected, status_text)
 
-        except Exception:
-            self.status_updated.emit(False, f"Error checking ({self.ip_address})")
+        except (OSError, ValueError, subprocess.SubprocessError):
+            # ping missing or not runnable, an address that cannot go into argv
+            # (NUL, unencodable characters), or ping outlived the timeout
+            self.status_updated.emit(self.ip_address, False, f"Error checking ({self.ip_address})")
 
 
 class CustomMessageBox(QDialog):
@@ -218,14 +565,14 @@ class CustomMessageBox(QDialog):
 
         # Icon
         icon_label = QLabel(icon_text)
-        icon_label.setFont(QFont("Segoe UI", 24))
+        icon_label.setFont(cached_font("Segoe UI", 24))
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         icon_label.setFixedSize(60, 60)
         content_layout.addWidget(icon_label)
 
         # Message
         message_label = QLabel(message)
-        message_label.setFont(QFont("Segoe UI", 11))
+        message_label.setFont(cached_font("Segoe UI", 11))
         message_label.setWordWrap(True)
         message_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         content_layout.addWidget(message_label, 1)
@@ -246,25 +593,7 @@ class CustomMessageBox(QDialog):
         self.setLayout(layout)
 
     def apply_styles(self):
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fa;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QPushButton {
-                padding: 8px 16px;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-                background-color: #a8dadc;
-                color: #333333;
-            }
-            QPushButton:hover {
-                background-color: #96d2d4;
-            }
-        """)
+        self.setStyleSheet(MESSAGE_BOX_STYLE)
 
 
 class PasswordDialog(QDialog):
@@ -283,13 +612,13 @@ class PasswordDialog(QDialog):
 
         # Title with emoji
         title_label = QLabel("🔒 Enter Password:")
-        title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title_label.setFont(cached_font("Segoe UI", 12, bold=True))
         layout.addWidget(title_label)
 
         # Password input
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.setFont(QFont("Segoe UI", 11))
+        self.password_input.setFont(cached_font("Segoe UI", 11))
         self.password_input.returnPressed.connect(self.accept)
         layout.addWidget(self.password_input)
 
@@ -311,36 +640,24 @@ class PasswordDialog(QDialog):
         # Focus on password input
         self.password_input.setFocus()
 
+    def showEvent(self, event):
+        """Put the cursor in the password field whenever the prompt appears"""
+        self.password_input.setFocus()
+        super().showEvent(event)
+
+    def reject(self):
+        """Drop whatever was typed when the prompt is cancelled"""
+        self.password_input.clear()
+        super().reject()
+
     def apply_styles(self):
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fa;
-            }
-            QLabel {
-                color: #333333;
-                margin: 10px;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #e9ecef;
-                border-radius: 5px;
-                background-color: white;
-                margin: 5px;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                opacity: 0.8;
-            }
-        """)
+        self.setStyleSheet(PASSWORD_DIALOG_STYLE)
 
     def get_password(self):
-        return self.password_input.text()
+        """Return the entered password and clear it from the field"""
+        password = self.password_input.text()
+        self.password_input.clear()
+        return password
 
 
 class SettingsDialog(QDialog):
@@ -360,7 +677,7 @@ class SettingsDialog(QDialog):
 
         # Title with emoji
         title_label = QLabel("⚙️ Settings")
-        title_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title_label.setFont(cached_font("Segoe UI", 16, bold=True))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
 
@@ -378,7 +695,7 @@ class SettingsDialog(QDialog):
         # Save button
         save_btn = QPushButton("Save Settings")
         save_btn.clicked.connect(self.save_settings)
-        save_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        save_btn.setFont(cached_font("Segoe UI", 12, bold=True))
         layout.addWidget(save_btn)
 
         self.setLayout(layout)
@@ -432,7 +749,7 @@ class SettingsDialog(QDialog):
         self.local_radio = QRadioButton("Local Folder")
         self.network_radio = QRadioButton("Network Folder")
 
-        if self.app.folder_type == "local":
+        if not self.app.is_network:
             self.local_radio.setChecked(True)
         else:
             self.network_radio.setChecked(True)
@@ -524,18 +841,33 @@ class SettingsDialog(QDialog):
         widget.setLayout(layout)
         self.tab_widget.addTab(widget, "⚙️ Preferences")
 
+    def reset_fields(self):
+        """Refresh the fields from the app so a reused dialog never shows stale values"""
+        self.source_path_edit.setText(self.app.source_path)
+        self.dest_path_edit.setText(self.app.destination_path)
+        self.local_radio.setChecked(not self.app.is_network)
+        self.network_radio.setChecked(self.app.is_network)
+        self.network_ip_edit.setText(self.app.network_ip)
+        self.current_password_edit.clear()
+        self.new_password_edit.clear()
+        self.auto_close_checkbox.setChecked(self.app.auto_close)
+        self.tab_widget.setCurrentIndex(0)
+
+    @pyqtSlot()
     def browse_source(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Source Folder")
         if folder:
             self.source_path_edit.setText(folder)
 
+    @pyqtSlot()
     def browse_destination(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Destination Folder")
         if folder:
             self.dest_path_edit.setText(folder)
 
+    @pyqtSlot()
     def change_password(self):
-        if self.current_password_edit.text() != self.app.password:
+        if not verify_password(self.current_password_edit.text(), self.app.password):
             QMessageBox.warning(self, "Error", "Current password is incorrect.")
             return
 
@@ -544,17 +876,25 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "Error", "New password must be at least 3 characters long.")
             return
 
-        self.app.password = new_password
+        self.app.password = hash_password(new_password)
         self.current_password_edit.clear()
         self.new_password_edit.clear()
         QMessageBox.information(self, "Success", "Password changed successfully!")
 
+    @pyqtSlot()
     def save_settings(self):
+        # Validate before touching app state; the address ends up on ping's command line
+        network_ip = self.network_ip_edit.text().strip()
+        if self.network_radio.isChecked() and not is_valid_host(network_ip):
+            QMessageBox.warning(self, "Error", "Please enter a valid network IP address or hostname.")
+            return
+
         # Update app settings
         self.app.source_path = self.source_path_edit.text()
         self.app.destination_path = self.dest_path_edit.text()
-        self.app.network_ip = self.network_ip_edit.text()
+        self.app.network_ip = network_ip
         self.app.folder_type = "local" if self.local_radio.isChecked() else "network"
+        self.app.is_network = self.app.folder_type == "network"
         self.app.auto_close = self.auto_close_checkbox.isChecked()
 
         if self.app.save_settings():
@@ -563,65 +903,7 @@ class SettingsDialog(QDialog):
             self.accept()
 
     def apply_styles(self):
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fa;
-            }
-            QLabel {
-                color: #333333;
-                font-size: 12px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e9ecef;
-                border-radius: 5px;
-                margin: 10px 0px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #e9ecef;
-                border-radius: 5px;
-                background-color: white;
-                margin: 2px;
-            }
-            QPushButton {
-                padding: 8px 16px;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 2px;
-                background-color: #a8dadc;
-                color: #333333;
-            }
-            QPushButton:hover {
-                background-color: #96d2d4;
-            }
-            QCheckBox, QRadioButton {
-                font-size: 11px;
-                color: #333333;
-                margin: 5px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #e9ecef;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                background-color: #e9ecef;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            QTabBar::tab:selected {
-                background-color: #a8dadc;
-            }
-        """)
+        self.setStyleSheet(SETTINGS_DIALOG_STYLE)
 
 
 class FolderCopierApp(QMainWindow):
@@ -634,14 +916,22 @@ class FolderCopierApp(QMainWindow):
         self.setFixedSize(1000, 1000)
 
         # Initialize variables
-        self.source_path = ""
-        self.destination_path = ""
-        self.network_ip = "127.0.0.1"
-        self.password = "password"
-        self.folder_type = "local"
-        self.auto_close = False
+        self.source_path = DEFAULT_SETTINGS['source_path']
+        self.destination_path = DEFAULT_SETTINGS['destination_path']
+        self.network_ip = DEFAULT_SETTINGS['network_ip']
+        self.password = hash_password(DEFAULT_SETTINGS['password'])
+        self.folder_type = DEFAULT_SETTINGS['folder_type']
+        self.is_network = self.folder_type == "network"
+        self.auto_close = DEFAULT_SETTINGS['auto_close']
         self.is_logged_in = False
         self.network_status = False
+        self.network_status_ip = None
+
+        # Last settings known to be on disk, used to skip redundant saves
+        self.saved_settings = None
+
+        # Settings the main display was last refreshed for
+        self.displayed_settings = None
 
         # Settings file
         self.settings_file = "settings.json"
@@ -653,11 +943,18 @@ class FolderCopierApp(QMainWindow):
         self.copy_worker = None
         self.network_checker = None
 
+        # Dialogs, built on first use and reused afterwards
+        self.password_dialog = None
+        self.settings_dialog = None
+
         # Load settings and setup UI
         self.load_settings()
+        self.update_absolute_paths()
         self.setup_ui()
         self.apply_styles()
-        self.check_network_status()
+
+        # Start the first network check once the window is up rather than mid-construction
+        QTimer.singleShot(0, self.check_network_status)
 
         # Connect log signal
         self.log_signal.connect(self.append_log)
@@ -667,11 +964,17 @@ class FolderCopierApp(QMainWindow):
     def setup_logging(self):
         """Setup logging system"""
         try:
-            if not os.path.exists('logs'):
-                os.makedirs('logs')
+            os.makedirs('logs', exist_ok=True)
 
             self.logger = logging.getLogger('FolderCopierApp')
             self.logger.setLevel(logging.INFO)
+            self.log_listener = None
+            self.log_buffer = None
+
+            # Handlers are attached once per process; another window must not
+            # open (and leak) a second handle on the same log file
+            if self.logger.handlers:
+                return
 
             # File handler
             log_filename = f"logs/app_{datetime.now().strftime('%Y%m%d')}.log"
@@ -690,13 +993,21 @@ class FolderCopierApp(QMainWindow):
             gui_formatter = logging.Formatter('%(asctime)s - %(message)s')
             self.gui_log_handler.setFormatter(gui_formatter)
 
-            if not self.logger.handlers:
-                self.logger.addHandler(file_handler)
-                self.logger.addHandler(self.gui_log_handler)
+            # The file is written from a listener thread; logging calls only enqueue
+            log_queue = queue.Queue()
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self.logger.addHandler(self.gui_log_handler)
+            self.log_buffer = logging.handlers.MemoryHandler(
+                LOG_BUFFER_CAPACITY, logging.WARNING, file_handler)
+            self.log_listener = PeriodicFlushQueueListener(
+                log_queue, self.log_buffer, flush_interval=LOG_FLUSH_INTERVAL)
+            self.log_listener.start()
 
         except Exception as e:
             print(f"Failed to setup logging: {str(e)}")
             self.logger = logging.getLogger('FolderCopierApp')
+            self.log_listener = None
+            self.log_buffer = None
 
     def setup_ui(self):
         """Setup the main user interface"""
@@ -709,7 +1020,7 @@ class FolderCopierApp(QMainWindow):
 
         # Title with emoji
         title_label = QLabel("📁 Folder Copier Pro")
-        title_label.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
+        title_label.setFont(cached_font("Segoe UI", 20, bold=True))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(title_label)
 
@@ -736,11 +1047,11 @@ class FolderCopierApp(QMainWindow):
         # Source folder
         source_layout = QVBoxLayout()
         source_label = QLabel("📁 Source Folder:")
-        source_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        source_label.setFont(cached_font("Segoe UI", 11, bold=True))
         source_layout.addWidget(source_label)
 
         self.source_display = QLabel(self.source_path or "Not selected")
-        self.source_display.setFont(QFont("Segoe UI", 10))
+        self.source_display.setFont(cached_font("Segoe UI", 10))
         self.source_display.setWordWrap(True)
         source_layout.addWidget(self.source_display)
 
@@ -749,11 +1060,11 @@ class FolderCopierApp(QMainWindow):
         # Destination folder
         dest_layout = QVBoxLayout()
         dest_label = QLabel("📁 Destination Folder:")
-        dest_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        dest_label.setFont(cached_font("Segoe UI", 11, bold=True))
         dest_layout.addWidget(dest_label)
 
         self.dest_display = QLabel(self.destination_path or "Not selected")
-        self.dest_display.setFont(QFont("Segoe UI", 10))
+        self.dest_display.setFont(cached_font("Segoe UI", 10))
         self.dest_display.setWordWrap(True)
         dest_layout.addWidget(self.dest_display)
 
@@ -764,54 +1075,42 @@ class FolderCopierApp(QMainWindow):
 
         # Folder type
         type_label = QLabel("📁 Type:")
-        type_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        type_label.setFont(cached_font("Segoe UI", 11, bold=True))
         status_layout.addWidget(type_label)
 
         self.type_display = QLabel(self.folder_type.title())
-        self.type_display.setFont(QFont("Segoe UI", 10))
+        self.type_display.setFont(cached_font("Segoe UI", 10))
         status_layout.addWidget(self.type_display)
 
         status_layout.addStretch()
 
         # Network status (only show for network type)
         self.network_label = QLabel("🌐 Network:")
-        self.network_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.network_label.setFont(cached_font("Segoe UI", 11, bold=True))
 
         self.network_status_label = QLabel("Checking...")
-        self.network_status_label.setFont(QFont("Segoe UI", 10))
+        self.network_status_label.setFont(cached_font("Segoe UI", 10))
+        self.network_status_label.setObjectName("networkStatusLabel")
 
         self.refresh_btn = QPushButton()
         self.refresh_btn.setIcon(create_black_white_emoji_icon("🍋", 29))
         self.refresh_btn.setIconSize(QSize(50, 50))
         self.refresh_btn.setFixedSize(50, 50)
         self.refresh_btn.clicked.connect(self.refresh_network_status)
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background: none;
-                border: none;
-                color: #000000;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(168, 218, 220, 0.3);
-                border-radius: 5px;
-            }
-            QPushButton:pressed {
-                background-color: rgba(168, 218, 220, 0.5);
-                border-radius: 5px;
-            }
-        """)
-
-        # Always add network elements to layout, but control visibility
-        status_layout.addWidget(self.network_label)
-        status_layout.addWidget(self.network_status_label)
-        status_layout.addWidget(self.refresh_btn)
+        self.refresh_btn.setObjectName("refreshButton")
+
+        # Network elements share one row so a single setVisible toggles them all
+        self.network_row = QWidget()
+        network_row_layout = QHBoxLayout()
+        network_row_layout.setContentsMargins(0, 0, 0, 0)
+        network_row_layout.addWidget(self.network_label)
+        network_row_layout.addWidget(self.network_status_label)
+        network_row_layout.addWidget(self.refresh_btn)
+        self.network_row.setLayout(network_row_layout)
+        status_layout.addWidget(self.network_row)
 
         # Set initial visibility based on folder type
-        self.network_label.setVisible(self.folder_type == "network")
-        self.network_status_label.setVisible(self.folder_type == "network")
-        self.refresh_btn.setVisible(self.folder_type == "network")
+        self.update_network_visibility()
 
         info_layout.addLayout(status_layout)
         info_frame.setLayout(info_layout)
@@ -842,7 +1141,7 @@ class FolderCopierApp(QMainWindow):
         self.log_display = QTextEdit()
         self.log_display.setMaximumHeight(150)
         self.log_display.setReadOnly(True)
-        self.log_display.setFont(QFont("Consolas", 9))
+        self.log_display.setFont(cached_font("Consolas", 9))
         log_layout.addWidget(self.log_display)
 
         # Log controls
@@ -865,21 +1164,24 @@ class FolderCopierApp(QMainWindow):
 
         # Copy button
         self.copy_btn = QPushButton("📁 Copy Folder")
-        self.copy_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.copy_btn.setObjectName("copyButton")
+        self.copy_btn.setFont(cached_font("Segoe UI", 12, bold=True))
         self.copy_btn.setMinimumHeight(50)
         self.copy_btn.clicked.connect(self.copy_folder)
         button_layout.addWidget(self.copy_btn)
 
         # Settings button
         self.settings_btn = QPushButton("⚙️ Settings")
-        self.settings_btn.setFont(QFont("Segoe UI", 12))
+        self.settings_btn.setObjectName("settingsButton")
+        self.settings_btn.setFont(cached_font("Segoe UI", 12))
         self.settings_btn.setMinimumHeight(50)
         self.settings_btn.clicked.connect(self.open_settings)
         button_layout.addWidget(self.settings_btn)
 
         # Logout button (hidden by default)
         self.logout_btn = QPushButton("🚪 Logout")
-        self.logout_btn.setFont(QFont("Segoe UI", 12))
+        self.logout_btn.setObjectName("logoutButton")
+        self.logout_btn.setFont(cached_font("Segoe UI", 12))
         self.logout_btn.setMinimumHeight(50)
         self.logout_btn.clicked.connect(self.logout)
         self.logout_btn.setVisible(self.is_logged_in)
@@ -889,153 +1191,204 @@ class FolderCopierApp(QMainWindow):
 
     def apply_styles(self):
         """Apply custom styles to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8f9fa;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QFrame {
-                background-color: #e9ecef;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 15px;
-                margin: 5px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                margin: 5px 0px;
-                padding-top: 15px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #495057;
-            }
-            QPushButton {
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-weight: bold;
-                margin: 2px;
-            }
-            QPushButton:hover {
-                opacity: 0.8;
-            }
-            QPushButton:pressed {
-                opacity: 0.6;
-            }
-            QProgressBar {
-                border: 2px solid #dee2e6;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #f8f9fa;
-            }
-            QProgressBar::chunk {
-                background-color: #b8e6b8;
-                border-radius: 3px;
-            }
-            QTextEdit {
-                border: 2px solid #dee2e6;
-                border-radius: 5px;
-                background-color: #ffffff;
-                color: #333333;
-            }
-        """)
-
-        # Set button colors
-        self.copy_btn.setStyleSheet("background-color: #b8e6b8; color: #333333;")
-        self.settings_btn.setStyleSheet("background-color: #a8dadc; color: #333333;")
-        self.logout_btn.setStyleSheet("background-color: #ffb3ba; color: #333333;")
+        # Button colors are keyed on object names, so one stylesheet covers the window
+        self.setStyleSheet(MAIN_WINDOW_STYLE)
 
     def load_settings(self):
         """Load settings from JSON file"""
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as file:
-                    settings = json.load(file)
-
-                    self.source_path = settings.get('source_path', '')
-                    self.destination_path = settings.get('destination_path', '')
-                    self.network_ip = settings.get('network_ip', '127.0.0.1')
-                    self.password = settings.get('password', 'password')
-                    self.folder_type = settings.get('folder_type', 'local')
-                    self.auto_close = settings.get('auto_close', False)
-
-        except Exception as e:
+            loaded = json.loads(Path(self.settings_file).read_bytes())
+            if not isinstance(loaded, dict):
+                raise ValueError("expected a JSON object")
+
+            # Keep known settings of the expected type; anything else keeps its default
+            valid = {key: value for key, value in loaded.items()
+                     if isinstance(value, SETTINGS_TYPES.get(key, ()))}
+            for key in (loaded.keys() - valid.keys()) & SETTINGS_TYPES.keys():
+                self.logger.warning("Ignoring invalid value for setting '%s'", key)
+            settings = {**DEFAULT_SETTINGS, **valid}
+            if settings['folder_type'] not in VALID_FOLDER_TYPES:
+                self.logger.warning("Ignoring unknown folder type '%s'", settings['folder_type'])
+                settings['folder_type'] = DEFAULT_SETTINGS['folder_type']
+            # The address ends up in ping's argv; a hand-edited file must not smuggle in options.
+            # Same rule as the settings dialog: only a network folder needs a valid address.
+            if settings['folder_type'] == 'network' and not is_valid_host(settings['network_ip']):
+                self.logger.warning("Ignoring invalid network address %r", settings['network_ip'])
+                settings['network_ip'] = DEFAULT_SETTINGS['network_ip']
+            plain_password = not settings['password'].startswith(PASSWORD_HASH_PREFIX)
+            if plain_password:
+                settings['password'] = hash_password(settings['password'])
+
+            self.source_path = settings['source_path']
+            self.destination_path = settings['destination_path']
+            self.network_ip = settings['network_ip']
+            self.password = settings['password']
+            self.folder_type = settings['folder_type']
+            self.is_network = self.folder_type == "network"
+            self.auto_close = settings['auto_close']
+
+            # Only trust the file as up to date if it already holds every setting as loaded
+            if settings.items() <= loaded.items():
+                self.saved_settings = settings
+
+            # Older settings files hold the password in plain text; rewrite them hashed
+            if plain_password:
+                self.logger.info("Migrating plain text password to a salted hash")
+                self.save_settings()
+
+        except FileNotFoundError:
+            # First run: keep the defaults set in __init__
+            pass
+
+        except (OSError, ValueError) as e:
+            # Unreadable or malformed file (JSON and UTF-8 decode errors are ValueErrors)
             QMessageBox.warning(self, "Settings Error", f"Failed to load settings: {str(e)}")
             self.save_settings()
 
     def save_settings(self):
         """Save settings to JSON file"""
         try:
-            settings = {
+            values = {
                 'source_path': self.source_path,
                 'destination_path': self.destination_path,
                 'network_ip': self.network_ip,
                 'password': self.password,
                 'folder_type': self.folder_type,
                 'auto_close': self.auto_close,
+            }
+
+            # Nothing changed since the last load/save: skip the disk write
+            if values == self.saved_settings:
+                self.logger.info("Settings unchanged, skipping save")
+                return True
+
+            settings = {
+                **values,
                 'version': '41',
                 'last_updated': datetime.now().isoformat()
             }
 
-            with open(self.settings_file, 'w', encoding='utf-8') as file:
-                json.dump(settings, file, indent=4, ensure_ascii=False)
+            # Serialize up front so the file is written with a single call
+            payload = json.dumps(settings, indent=4, ensure_ascii=False).encode('utf-8')
+
+            # Write to a temporary file, fsync it, and swap it in atomically so a crash
+            # or power loss leaves either the old or the new settings on disk, never half of one
+            temp_file = self.settings_file + ".tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.settings_file)
+            except OSError:
+                # Don't leave a partial temp file behind
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+                raise
 
+            self.saved_settings = values
             return True
 
-        except Exception as e:
+        except OSError as e:
             QMessageBox.critical(self, "Settings Error", f"Failed to save settings: {str(e)}")
             return False
 
     def update_display(self):
         """Update the main display"""
+        displayed = (self.source_path, self.destination_path, self.folder_type, self.network_ip)
+        if displayed == self.displayed_settings:
+            return
+        self.displayed_settings = displayed
+
         self.source_display.setText(self.source_path or "Not selected")
         self.dest_display.setText(self.destination_path or "Not selected")
         self.type_display.setText(self.folder_type.title())
+        self.update_absolute_paths()
 
         # Show/hide network status based on folder type
-        self.network_label.setVisible(self.folder_type == "network")
-        self.network_status_label.setVisible(self.folder_type == "network")
-        self.refresh_btn.setVisible(self.folder_type == "network")
+        self.update_network_visibility()
 
-        if self.folder_type == "network":
+        # Only ping again if the current IP has no successful result yet
+        if self.is_network and not (self.network_status and
+                                    self.network_status_ip == self.network_ip):
             self.check_network_status()
 
         self.logger.info("Display updated")
 
+    def update_absolute_paths(self):
+        """Normalize the configured folders once per settings change"""
+        self.source_abs = os.path.abspath(self.source_path) if self.source_path else ""
+        self.destination_abs = os.path.abspath(self.destination_path) if self.destination_path else ""
+
+    def update_network_visibility(self):
+        """Show the network status widgets only for network folders"""
+        self.network_row.setVisible(self.is_network)
+
     def check_network_status(self):
         """Check network connectivity"""
-        if self.folder_type == "network":
+        if self.is_network:
+            # Coalesce requests while a check is in flight; network_check_finished
+            # starts a fresh one if the IP changed in the meantime
+            if self.network_checker and self.network_checker.isRunning():
+                return
+
+            self.refresh_btn.setEnabled(False)
             self.network_status_label.setText("Checking...")
-            self.logger.info(f"Checking network connectivity to {self.network_ip}")
-            self.network_checker = NetworkChecker(self.network_ip)
+            self.logger.info("Checking network connectivity to %s", self.network_ip)
+            # Parented so a superseded checker survives until its finished is handled
+            self.network_checker = NetworkChecker(self.network_ip, self)
             self.network_checker.status_updated.connect(self.update_network_status)
+            self.network_checker.finished.connect(self.network_check_finished)
             self.network_checker.start()
 
-    def update_network_status(self, is_connected, status_text):
+    @pyqtSlot(str, bool, str)
+    def update_network_status(self, checked_ip, is_connected, status_text):
         """Update network status display"""
+        # A queued result for an address the settings have since moved away from
+        # says nothing about the current one
+        if checked_ip != self.network_ip:
+            return
+
         self.network_status = is_connected
+        self.network_status_ip = checked_ip
         self.network_status_label.setText(status_text)
 
+        # The color comes from MAIN_WINDOW_STYLE; re-polish only when it actually flips
+        if self.network_status_label.property("connected") != is_connected:
+            self.network_status_label.setProperty("connected", is_connected)
+            self.network_status_label.style().unpolish(self.network_status_label)
+            self.network_status_label.style().polish(self.network_status_label)
+
         if is_connected:
-            self.network_status_label.setStyleSheet("color: #28a745; font-weight: bold;")
-            self.logger.info(f"Network connection successful to {self.network_ip}")
+            self.logger.info("Network connection successful to %s", self.network_ip)
         else:
-            self.network_status_label.setStyleSheet("color: #dc3545; font-weight: bold;")
-            self.logger.warning(f"Network connection failed to {self.network_ip}")
+            self.logger.warning("Network connection failed to %s", self.network_ip)
+
+    @pyqtSlot()
+    def network_check_finished(self):
+        """Release the finished checker and re-check if the settings changed mid-check"""
+        checker = self.sender()
+        checker.deleteLater()
+
+        # A late finished from a superseded checker must not touch the one now running
+        if checker is not self.network_checker:
+            return
+
+        self.network_checker = None
+        self.refresh_btn.setEnabled(True)
 
+        if self.is_network and self.network_status_ip != self.network_ip:
+            self.check_network_status()
+
+    @pyqtSlot()
     def refresh_network_status(self):
         """Refresh network status"""
-        self.logger.info(f"Manual network status refresh requested for {self.network_ip}")
+        self.logger.info("Manual network status refresh requested for %s", self.network_ip)
         self.check_network_status()
 
+    @pyqtSlot(str)
     def append_log(self, message):
         """Append message to log display"""
         self.log_display.append(message)
@@ -1043,10 +1396,12 @@ class FolderCopierApp(QMainWindow):
         scrollbar = self.log_display.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    @pyqtSlot()
     def clear_log(self):
         """Clear the log display"""
         self.log_display.clear()
 
+    @pyqtSlot()
     def copy_folder(self):
         """Start folder copy operation"""
         # Validate inputs
@@ -1055,44 +1410,52 @@ class FolderCopierApp(QMainWindow):
                                 "Please set source and destination folders in settings.")
             return
 
-        # Check if source and destination are the same
+        # One stat per path answers "does it exist", "is it a folder" and "is it the same folder";
+        # a path with an embedded NUL (hand-edited settings) raises ValueError and counts as missing
         try:
-            source_abs = os.path.abspath(self.source_path)
-            dest_abs = os.path.abspath(self.destination_path)
-            if source_abs == dest_abs:
-                QMessageBox.critical(self, "Path Error",
-                                     "Source and destination folders cannot be the same.\n\n"
-                                     f"Source: {source_abs}\n"
-                                     f"Destination: {dest_abs}")
-                self.logger.error(f"Source and destination paths are identical: {source_abs}")
-                return
-
-            # Check if source is within destination or vice versa
-            if source_abs.startswith(dest_abs + os.sep) or dest_abs.startswith(source_abs + os.sep):
-                QMessageBox.critical(self, "Path Error",
-                                     "Source and destination folders cannot be nested within each other.\n\n"
-                                     f"Source: {source_abs}\n"
-                                     f"Destination: {dest_abs}")
-                self.logger.error(f"Source and destination paths are nested: {source_abs} <-> {dest_abs}")
-                return
+            source_stat = os.stat(self.source_path)
+        except (OSError, ValueError):
+            source_stat = None
+        try:
+            destination_stat = os.stat(self.destination_path)
+        except (OSError, ValueError):
+            destination_stat = None
+
+        # Check if source and destination are the same; samestat also catches
+        # links and case-insensitive spellings of the same folder
+        source_abs = self.source_abs
+        dest_abs = self.destination_abs
+        if source_abs == dest_abs or (source_stat and destination_stat and
+                                      os.path.samestat(source_stat, destination_stat)):
+            QMessageBox.critical(self, "Path Error",
+                                 "Source and destination folders cannot be the same.\n\n"
+                                 f"Source: {source_abs}\n"
+                                 f"Destination: {dest_abs}")
+            self.logger.error("Source and destination paths are identical: %s", source_abs)
+            return
 
-        except Exception as e:
-            QMessageBox.warning(self, "Path Validation Error",
-                                f"Could not validate folder paths: {str(e)}")
-            self.logger.error(f"Path validation failed: {str(e)}")
+        # Check if source is within destination or vice versa
+        if source_abs.startswith(dest_abs + os.sep) or dest_abs.startswith(source_abs + os.sep):
+            QMessageBox.critical(self, "Path Error",
+                                 "Source and destination folders cannot be nested within each other.\n\n"
+                                 f"Source: {source_abs}\n"
+                                 f"Destination: {dest_abs}")
+            self.logger.error("Source and destination paths are nested: %s <-> %s", source_abs, dest_abs)
             return
 
-        if not os.path.exists(self.source_path):
+        if not (source_stat and stat.S_ISDIR(source_stat.st_mode)):
             QMessageBox.critical(self, "Source Error",
                                  f"Source folder does not exist:\n{self.source_path}")
             return
 
-        if not os.path.exists(self.destination_path):
+        if not (destination_stat and stat.S_ISDIR(destination_stat.st_mode)):
             QMessageBox.critical(self, "Destination Error",
                                  f"Destination folder does not exist:\n{self.destination_path}")
             return
 
-        if self.folder_type == "network" and not self.network_status:
+        # Reuse the last background check, but only if it was for the current IP
+        if self.is_network and not (self.network_status and
+                                    self.network_status_ip == self.network_ip):
             QMessageBox.warning(self, "Network Error",
                                 "No connection to the network. Please check network settings.")
             return
@@ -1114,8 +1477,9 @@ class FolderCopierApp(QMainWindow):
         self.copy_worker.log_message.connect(self.append_log)
         self.copy_worker.start()
 
-        self.logger.info(f"Copy operation started: {self.source_path} → {self.destination_path}")
+        self.logger.info("Copy operation started: %s → %s", self.source_path, self.destination_path)
 
+    @pyqtSlot()
     def cancel_copy(self):
         """Cancel the current copy operation"""
         if self.copy_worker and self.copy_worker.isRunning():
@@ -1124,11 +1488,13 @@ class FolderCopierApp(QMainWindow):
             self.logger.info("Copy operation cancelled by user")
             self.reset_copy_ui()
 
+    @pyqtSlot(int, str)
     def update_progress(self, value, text):
         """Update progress bar and text"""
         self.progress_bar.setValue(value)
         self.progress_label.setText(text)
 
+    @pyqtSlot(bool, str)
     def copy_finished(self, success, message):
         """Handle copy operation completion"""
         self.reset_copy_ui()
@@ -1158,7 +1524,7 @@ class FolderCopierApp(QMainWindow):
                 "error"
             )
             error_dialog.exec()
-            self.logger.error(f"Copy operation failed: {message}")
+            self.logger.error("Copy operation failed: %s", message)
 
     def reset_copy_ui(self):
         """Reset copy-related UI elements"""
@@ -1170,6 +1536,7 @@ class FolderCopierApp(QMainWindow):
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
 
+    @pyqtSlot()
     def open_settings(self):
         """Open settings dialog"""
         if self.is_logged_in:
@@ -1179,10 +1546,11 @@ class FolderCopierApp(QMainWindow):
 
     def show_password_dialog(self):
         """Show password authentication dialog"""
-        dialog = PasswordDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            password = dialog.get_password()
-            if password == self.password:
+        if self.password_dialog is None:
+            self.password_dialog = PasswordDialog(self)
+        if self.password_dialog.exec() == QDialog.DialogCode.Accepted:
+            password = self.password_dialog.get_password()
+            if verify_password(password, self.password):
                 self.is_logged_in = True
                 self.logout_btn.setVisible(True)
                 self.show_settings_dialog()
@@ -1193,9 +1561,12 @@ class FolderCopierApp(QMainWindow):
 
     def show_settings_dialog(self):
         """Show settings configuration dialog"""
-        dialog = SettingsDialog(self, self)
-        dialog.exec()
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self, self)
+        self.settings_dialog.reset_fields()
+        self.settings_dialog.exec()
 
+    @pyqtSlot()
     def logout(self):
         """Logout current user"""
         self.is_logged_in = False
@@ -1213,6 +1584,15 @@ class FolderCopierApp(QMainWindow):
             self.network_checker.wait()
 
         self.logger.info("Application closed")
+
+        # Write out anything still queued or buffered for the log file
+        if self.log_listener:
+            self.log_listener.stop()
+            self.log_listener = None
+            file_handler = self.log_buffer.target
+            self.log_buffer.close()
+            file_handler.close()
+
         event.accept()
 
 